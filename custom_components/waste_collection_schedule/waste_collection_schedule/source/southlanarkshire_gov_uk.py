@@ -1,12 +1,25 @@
-from datetime import datetime, timedelta
+import logging
 import re
+import time
+from datetime import date, datetime, timedelta
 from io import BytesIO
+from itertools import cycle
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from pypdf import PdfReader
+from requests.adapters import HTTPAdapter
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
 
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+_LOGGER = logging.getLogger(__name__)
+
 TITLE = "South Lanarkshire Council"
 DESCRIPTION = "Source for South Lanarkshire Council waste collection."
 URL = "https://www.southlanarkshire.gov.uk"
@@ -29,7 +42,7 @@ PARAM_DESCRIPTIONS = {
         "calendar_title": "A more readable, or user-friendly, name for the waste calendar. If nothing is provided, the name returned by the source will be used.",
         "record_id": "The 6-digit number in your URL (e.g., 574605).",
         "street_name": "The text at the end of your URL (e.g., clincarthill_road_rutherglen).",
-        "pdf_url": "REQUIRED: Full URL to council's bin collection calendar PDF. This is essential for determining your exact position in the 4-week collection cycle, as black bins appear twice per cycle. Find PDFs at https://www.southlanarkshire.gov.uk/downloads/download/791/bin_collection_calendars",
+        "pdf_url": "Optional: Full URL to council's bin collection calendar PDF. When given, it is used to confirm your position in the 4-week collection cycle in weeks where only the black bin is collected. Find PDFs at https://www.southlanarkshire.gov.uk/downloads/download/791/bin_collection_calendars",
     }
 }
 
@@ -44,6 +57,10 @@ TEST_CASES = {
         "street_name": "alexander_balfour_gardens_hamilton",
         "pdf_url": "https://www.southlanarkshire.gov.uk/downloads/file/18300/hamilton_and_clydesdale_bin_collection_calendar_2026_-_households_with_4_bins",
     },
+    "Rutherglen without PDF": {
+        "record_id": "574605",
+        "street_name": "clincarthill_road_rutherglen",
+    },
 }
 
 ICON_MAP = {
@@ -62,35 +79,98 @@ SORT_ORDER = {
     "Green": 4,
 }
 
+# Base 4-week cycle: Black, Grey+Burgundy, Black, Blue+Burgundy
+_BASE_PATTERN = (
+    ("Black/Green - Non Recyclable Waste",),
+    ("Light Grey - Glass, cans and plastics", "Burgundy - Food and garden"),
+    ("Black/Green - Non Recyclable Waste",),
+    ("Blue (paper and card)", "Burgundy - Food and garden"),
+)
+# (bin type, icon) pairs for each cycle week, ordered by SORT_ORDER so collections are emitted sorted
+_WEEK_BINS = tuple(
+    tuple(
+        (bin_type, ICON_MAP.get(bin_type.split()[0], "mdi:trash-can"))
+        for bin_type in sorted(week, key=lambda bin_type: SORT_ORDER.get(bin_type.split()[0], 99))
+    )
+    for week in _BASE_PATTERN
+)
+# The cycle rotated to start at each of the 4 positions
+_PATTERNS = tuple(_WEEK_BINS[position:] + _WEEK_BINS[:position] for position in range(4))
+
+# Shared across fetches so scheduled updates can reuse the keep-alive connection
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+# Everything read from the directory page lives in div.bin-dir-snip or the schedule table
+_DIRECTORY_STRAINER = SoupStrainer(["div", "table"])
+
+# Parsed PDF schedules keyed by (pdf_url, year): (time cached, ETag, Last-Modified, schedule).
+# Within the TTL the PDF is not requested at all; after it the cached copy is revalidated.
+_PDF_SCHEDULE_CACHE: dict[tuple[str, int], tuple[float, str | None, str | None, dict]] = {}
+_PDF_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+
+_YEAR_RE = re.compile(r"20\d{2}")
+_DAY_RE = re.compile(r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)")
+_DAY_NUM = {
+    "Monday": 0,
+    "Tuesday": 1,
+    "Wednesday": 2,
+    "Thursday": 3,
+    "Friday": 4,
+    "Saturday": 5,
+    "Sunday": 6,
+}
+_MONTH_DATE_RE = re.compile(
+    r"(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)"
+)
+_MONTH_NUM = {
+    "January": 1,
+    "February": 2,
+    "March": 3,
+    "April": 4,
+    "May": 5,
+    "June": 6,
+    "July": 7,
+    "August": 8,
+    "September": 9,
+    "October": 10,
+    "November": 11,
+    "December": 12,
+}
+# Bin colour each keyword stands for
+_BIN_KEYWORDS = {
+    "black": "black",
+    "green": "black",
+    "blue": "blue",
+    "grey": "grey",
+    "gray": "grey",
+    "burgundy": "burgundy",
+    "brown": "burgundy",
+}
+_BIN_KEYWORD_RE = re.compile("|".join(_BIN_KEYWORDS))
+
+# Bin type for each ISO week number modulo 4
+_WEEK_TYPES = ("black", "grey+burgundy", "black", "blue+burgundy")
+
 
 class Source:
-    def __init__(self, record_id: str | int, street_name: str, pdf_url: str):
-        if not pdf_url:
-            raise ValueError(
-                "pdf_url is required to determine collection cycle position. "
-                "Black bins appear twice in the 4-week cycle, making position impossible to determine without PDF reference. "
-                "Find PDFs at: https://www.southlanarkshire.gov.uk/downloads/download/791/bin_collection_calendars"
-            )
+    def __init__(self, record_id: str | int, street_name: str, pdf_url: str | None = None):
         self._record_id = str(record_id).zfill(6)
         self._street_name = str(street_name)
         self._pdf_url = pdf_url
     
     def fetch(self):
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Get current week's bins from website
-        s = requests.Session()
-        s.headers.update({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"})
-        
-        r = s.get(
-            f"https://www.southlanarkshire.gov.uk/directory_record/{self._record_id}/{self._street_name}"
+        r = _SESSION.get(
+            f"https://www.southlanarkshire.gov.uk/directory_record/{self._record_id}/{self._street_name}",
+            timeout=30,
         )
         r.raise_for_status()
 
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = BeautifulSoup(r.text, HTML_PARSER, parse_only=_DIRECTORY_STRAINER)
         
-        bin_div = soup.find("div", {"class": "bin-dir-snip"})
+        bin_div = soup.select_one("div.bin-dir-snip")
         if not bin_div:
             raise Exception("Could not find bin collection info")
             
@@ -98,194 +178,227 @@ class Source:
         if not week_para:
             raise Exception("Could not find week information")
             
-        week_text = week_para.text.strip()
+        week_text = week_para.get_text(" ", strip=True)
         parts = week_text.split(" to ")
         if len(parts) != 2:
             raise Exception(f"Unexpected week format: {week_text}")
             
         start_date_str = parts[0].strip()
-        current_week_start = datetime.strptime(start_date_str, "%A %d %B %Y").date()
+        # "Monday 26 January 2026" - the weekday name is implied by the date itself
+        try:
+            _, day, month_name, year = start_date_str.split()
+            current_week_start = date(int(year), _MONTH_NUM[month_name], int(day))
+        except (KeyError, ValueError):
+            raise Exception(f"Unexpected week format: {week_text}")
         
         bins_this_week = set()
-        bins_this_week_elements = bin_div.find_all("li")
-        for li in bins_this_week_elements:
-            h4 = li.find("h4")
-            if h4:
-                bin_name = h4.text.strip().lower()
-                bins_this_week.add(bin_name)
+        for h4 in bin_div.select("li h4"):
+            bin_name = h4.get_text(strip=True).lower()
+            bins_this_week.add(bin_name)
         
         table = soup.find("table")
         if not table:
             raise Exception("Could not find collection schedule table")
             
-        rows = table.find_all("tr")
         collection_day = None
         
-        for row in rows:
+        for row in table.select("tr"):
             th = row.find("th")
             td = row.find("td")
             if th and td:
-                schedule_text = td.text.strip()
-                day_match = re.match(r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)', schedule_text)
-                if day_match and collection_day is None:
+                schedule_text = td.get_text(strip=True)
+                day_match = _DAY_RE.match(schedule_text)
+                if day_match:
+                    # Only the first listed day is used, so stop scanning rows here
                     collection_day = day_match.group(1)
+                    break
         
         if not collection_day:
             raise Exception("Could not determine collection day")
         
-        day_map = {
-            "Monday": 0, "Tuesday": 1, "Wednesday": 2, "Thursday": 3,
-            "Friday": 4, "Saturday": 5, "Sunday": 6,
-        }
-        collection_day_num = day_map[collection_day]
+        collection_day_num = _DAY_NUM[collection_day]
         
         days_to_collection = (collection_day_num - current_week_start.weekday()) % 7
         current_collection_date = current_week_start + timedelta(days=days_to_collection)
         
-        logger.debug(f"Current week start: {current_week_start}, Collection day: {collection_day}, First collection date: {current_collection_date}")
-        logger.debug(f"Bins this week from website: {bins_this_week}")
+        _LOGGER.debug(
+            "Current week start: %s, Collection day: %s, First collection date: %s",
+            current_week_start, collection_day, current_collection_date,
+        )
+        _LOGGER.debug("Bins this week from website: %s", bins_this_week)
         
-        # Parse PDF to determine position in 4-week cycle
-        pdf_schedule = self._parse_pdf_schedule()
-        cycle_position = self._determine_cycle_position(current_week_start, pdf_schedule, bins_this_week)
+        # Parse PDF to determine position in 4-week cycle. Only black-only weeks are ambiguous
+        # (positions 0 and 2); any other week's bins fix the position without the PDF.
+        current_week_type = self._identify_bin_combination(bins_this_week)
+        pdf_schedule = {}
+        if current_week_type == "black":
+            if self._pdf_url:
+                pdf_schedule = self._parse_pdf_schedule()
+            else:
+                # Without a PDF, apply the week-number rule the PDF parser uses to next week's Monday,
+                # which _determine_cycle_position then looks up exactly like a PDF date
+                next_week_date = current_week_start + timedelta(weeks=1)
+                pdf_schedule = {next_week_date: _WEEK_TYPES[next_week_date.isocalendar()[1] % 4]}
+        cycle_position = self._determine_cycle_position(current_week_start, pdf_schedule, current_week_type)
         pattern_cycle = self._get_pattern_from_cycle_position(cycle_position)
         
-        logger.debug(f"Website bins: {bins_this_week}, Detected position: {cycle_position}, Expected pattern at position 0: {pattern_cycle[0]}")
-        logger.debug(f"Cycle position detected: {cycle_position}, Pattern: {pattern_cycle}")
+        _LOGGER.debug(
+            "Website bins: %s, Detected position: %s, Expected pattern at position 0: %s",
+            bins_this_week, cycle_position, pattern_cycle[0],
+        )
+        _LOGGER.debug("Cycle position detected: %s, Pattern: %s", cycle_position, pattern_cycle)
+        
+        collection_dates = [current_collection_date + timedelta(weeks=week_offset) for week_offset in range(52)]
         
+        # Weeks are generated in date order and each week's bins are already in SORT_ORDER,
+        # so the collections come out sorted by date, then bin priority
         collections = []
-        for week_offset in range(52):
-            collection_date = current_collection_date + timedelta(weeks=week_offset)
-            bins_for_week = pattern_cycle[week_offset % len(pattern_cycle)]
-            
-            for bin_type in bins_for_week:
-                bin_color = bin_type.split()[0]
-                icon = ICON_MAP.get(bin_color, "mdi:trash-can")
+        # The rotated pattern already starts at the current week, so walk it in step with the dates
+        for collection_date, bins_for_week in zip(collection_dates, cycle(pattern_cycle)):
+            for bin_type, icon in bins_for_week:
                 collections.append(
                     Collection(date=collection_date, t=bin_type, icon=icon)
                 )
         
-        def get_sort_key(entry):
-            bin_color = entry.type.split()[0] if entry.type else ""
-            sort_order = SORT_ORDER.get(bin_color, 99)
-            return (entry.date, sort_order)
-        
-        collections.sort(key=get_sort_key)
-        
         # Log first 20 collections being passed to HA calendar (debug level)
-        logger.debug(f"Total collections being sent to HA: {len(collections)}")
-        for i, collection in enumerate(collections[:20]):
-            logger.debug(f"  [{i+1}] {collection.date} ({collection.date.strftime('%A')}): {collection.type} (icon: {collection.icon})")
+        _LOGGER.debug("Total collections being sent to HA: %d", len(collections))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            for i, collection in enumerate(collections[:20]):
+                _LOGGER.debug(
+                    "  [%d] %s (%s): %s (icon: %s)",
+                    i + 1, collection.date, collection.date.strftime("%A"), collection.type, collection.icon,
+                )
         
         return collections
     
     def _parse_pdf_schedule(self):
         """Parse PDF to extract bin collection schedule for multiple weeks."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        s = requests.Session()
-        s.headers.update({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"})
+        current_year = datetime.now().year
+        cache_key = (self._pdf_url, current_year)
+        cached = _PDF_SCHEDULE_CACHE.get(cache_key)
+        headers = {}
+        if cached:
+            cached_at, cached_etag, cached_last_modified, cached_schedule = cached
+            if time.monotonic() - cached_at < _PDF_CACHE_TTL:
+                _LOGGER.debug("Using cached PDF schedule")
+                return cached_schedule
+            if cached_etag:
+                headers["If-None-Match"] = cached_etag
+            if cached_last_modified:
+                headers["If-Modified-Since"] = cached_last_modified
         
         # Add timeout to prevent hanging in Home Assistant
-        logger.debug(f"Downloading PDF from: {self._pdf_url}")
-        response = s.get(self._pdf_url, timeout=30)
-        response.raise_for_status()
-        logger.debug(f"PDF downloaded, size: {len(response.content)} bytes")
-        
-        pdf_reader = PdfReader(BytesIO(response.content))
+        _LOGGER.debug("Downloading PDF from: %s", self._pdf_url)
+        with _SESSION.get(self._pdf_url, headers=headers, timeout=30, stream=True) as response:
+            if cached and response.status_code == 304:
+                _LOGGER.debug("PDF not modified since last download, reusing parsed schedule")
+                _PDF_SCHEDULE_CACHE[cache_key] = (
+                    time.monotonic(), cached_etag, cached_last_modified, cached_schedule
+                )
+                return cached_schedule
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            
+            # Write the body in chunks straight into the buffer PdfReader reads from,
+            # rather than buffering it in response.content first
+            pdf_data = BytesIO()
+            for chunk in response.iter_content(chunk_size=65536):
+                pdf_data.write(chunk)
+        _LOGGER.debug("PDF downloaded, size: %d bytes", pdf_data.tell())
+        pdf_data.seek(0)
+        
+        pdf_reader = PdfReader(pdf_data)
         schedule = {}
         
-        logger.debug(f"PDF has {len(pdf_reader.pages)} pages")
+        _LOGGER.debug("PDF has %d pages", len(pdf_reader.pages))
         
         # Try to detect year from PDF filename or content
-        year_from_url = re.search(r'20\d{2}', self._pdf_url)
-        current_year = datetime.now().year
+        year_from_url = _YEAR_RE.search(self._pdf_url)
         years_to_try = [current_year]
         if year_from_url:
             pdf_year = int(year_from_url.group())
             if pdf_year not in years_to_try:
                 years_to_try.insert(0, pdf_year)
         years_to_try.append(current_year + 1)  # Also try next year
-        logger.debug(f"Will try years: {years_to_try}")
+        _LOGGER.debug("Will try years: %s", years_to_try)
+        
+        # Skip pages that cannot show any text (e.g. artwork-only covers) before extraction
+        text_pages = [
+            (page_num, page) for page_num, page in enumerate(pdf_reader.pages, start=1) if self._page_has_text(page)
+        ]
+        _LOGGER.debug("%d of %d pages may contain text", len(text_pages), len(pdf_reader.pages))
         
         # Extract text from all pages and parse dates and bins
-        all_text = ""
-        for page_num in range(len(pdf_reader.pages)):
-            page = pdf_reader.pages[page_num]
+        text_parts: list[str] = []
+        for page_num, page in text_pages:
             # Try layout mode first, fall back to default if not supported
             try:
                 text = page.extract_text(extraction_mode="layout")
-                logger.debug(f"Page {page_num + 1}: extracted text with layout mode")
+                _LOGGER.debug("Page %d: extracted text with layout mode", page_num)
             except (TypeError, AttributeError) as e:
                 # Older pypdf versions don't support extraction_mode parameter
                 text = page.extract_text()
-                logger.debug(f"Page {page_num + 1}: extracted text with default mode (layout not supported: {e})")
+                _LOGGER.debug("Page %d: extracted text with default mode (layout not supported: %s)", page_num, e)
             if text:
-                all_text += text + "\n"
-                logger.debug(f"Page {page_num + 1}: extracted {len(text)} characters")
+                text_parts.append(text)
+                _LOGGER.debug("Page %d: extracted %d characters", page_num, len(text))
             else:
-                logger.debug(f"Page {page_num + 1}: no text extracted")
+                _LOGGER.debug("Page %d: no text extracted", page_num)
+        all_text = "\n".join(text_parts)
         
-        logger.debug(f"Total text extracted: {len(all_text)} characters")
+        _LOGGER.debug("Total text extracted: %d characters", len(all_text))
         
         if not all_text.strip():
-            logger.error("No text extracted from PDF at all - PDF may be image-based or encrypted")
+            _LOGGER.error("No text extracted from PDF at all - PDF may be image-based or encrypted")
             return schedule
         
-        # Log first 1000 chars AND last 500 chars to help debug
-        logger.debug(f"First 1000 chars of PDF text: {all_text[:1000]}")
-        logger.debug(f"Last 500 chars of PDF text: {all_text[-500:]}")
+        # Log first 1000 chars AND last 500 chars to help debug (slicing only when debug is on)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("First 1000 chars of PDF text: %s", all_text[:1000])
+            _LOGGER.debug("Last 500 chars of PDF text: %s", all_text[-500:])
         
-        # Check if bin keywords exist ANYWHERE in the PDF
-        bin_keywords = ["black", "blue", "grey", "gray", "burgundy", "brown", "green"]
-        found_keywords = [kw for kw in bin_keywords if kw in all_text.lower()]
-        logger.debug(f"Bin keywords found in entire PDF: {found_keywords}")
+        # Check if bin keywords exist ANYWHERE in the PDF (single pass over the text)
+        found_keywords = sorted(set(_BIN_KEYWORD_RE.findall(all_text.lower())))
+        _LOGGER.debug("Bin keywords found in entire PDF: %s", found_keywords)
         
         # If NO keywords found, try alternative extraction without layout mode
         if not found_keywords:
-            logger.debug("No bin keywords found with layout mode, trying default extraction...")
-            all_text_alt = ""
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text = page.extract_text()
-                if text:
-                    all_text_alt += text + "\n"
-            logger.debug(f"Alternative extraction: {len(all_text_alt)} characters")
-            logger.debug(f"Alternative first 1000 chars: {all_text_alt[:1000]}")
+            _LOGGER.debug("No bin keywords found with layout mode, trying default extraction...")
+            all_text_alt = "\n".join(
+                text for text in (page.extract_text() for _, page in text_pages) if text
+            )
+            _LOGGER.debug("Alternative extraction: %d characters", len(all_text_alt))
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Alternative first 1000 chars: %s", all_text_alt[:1000])
             
             # Check keywords again
-            found_keywords_alt = [kw for kw in bin_keywords if kw in all_text_alt.lower()]
-            logger.debug(f"Alternative extraction bin keywords: {found_keywords_alt}")
+            found_keywords_alt = sorted(set(_BIN_KEYWORD_RE.findall(all_text_alt.lower())))
+            _LOGGER.debug("Alternative extraction bin keywords: %s", found_keywords_alt)
             
             # Use alternative text if it has more keywords
             if len(found_keywords_alt) > len(found_keywords):
-                logger.debug("Using alternative extraction as it has more bin keywords")
+                _LOGGER.debug("Using alternative extraction as it has more bin keywords")
                 all_text = all_text_alt
                 found_keywords = found_keywords_alt
         
-        # Parse all dates from PDF
-        simple_date_pattern = r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)'
-        
-        # Extract ALL dates first
-        all_pdf_dates = []
-        date_matches = re.finditer(simple_date_pattern, all_text)
-        for date_match in date_matches:
-            day, month = date_match.groups()
+        # Extract ALL dates from PDF
+        pdf_dates = set()
+        # Calendars repeat the same day/month text (legends, multiple leaflets); resolve each once
+        for day, month in set(_MONTH_DATE_RE.findall(all_text)):
+            day_num, month_num = int(day), _MONTH_NUM[month]
             for year in years_to_try:
                 try:
-                    date_obj = datetime.strptime(f"{day} {month} {year}", "%d %B %Y").date()
-                    if date_obj not in all_pdf_dates:
-                        all_pdf_dates.append(date_obj)
+                    pdf_dates.add(date(year, month_num, day_num))
                     break
                 except ValueError:
                     continue
         
-        all_pdf_dates.sort()
-        logger.debug(f"Found {len(all_pdf_dates)} unique dates in PDF")
+        all_pdf_dates = sorted(pdf_dates)
+        _LOGGER.debug("Found %d unique dates in PDF", len(all_pdf_dates))
         
         if not all_pdf_dates:
-            logger.error("No dates found in PDF")
+            _LOGGER.error("No dates found in PDF")
             return schedule
         
         # Analyze date intervals to identify bin types
@@ -293,75 +406,48 @@ class Source:
         # Strategy: Use known 4-week pattern and match dates to it
         
         # Log first 10 dates for debugging
-        logger.debug(f"First 10 PDF dates: {all_pdf_dates[:10]}")
+        _LOGGER.debug("First 10 PDF dates: %s", all_pdf_dates[:10])
         
         # Match dates to the 4-week pattern using interval analysis
         # Week 0: Black, Week 1: Grey+Burgundy, Week 2: Black, Week 3: Blue+Burgundy
         for date_obj in all_pdf_dates:
-            # Determine week of year to establish pattern
-            week_num = date_obj.isocalendar()[1]
-            cycle_pos = week_num % 4
-            
-            # Map cycle position to bin type (rough estimate - will refine with current week)
-            if cycle_pos == 0:
-                schedule[date_obj] = "black"
-            elif cycle_pos == 1:
-                schedule[date_obj] = "grey+burgundy"
-            elif cycle_pos == 2:
-                schedule[date_obj] = "black"
-            else:  # cycle_pos == 3
-                schedule[date_obj] = "blue+burgundy"
-        
-        logger.debug(f"Assigned bins to {len(schedule)} dates using week-based pattern")
+            # Map week of year to bin type (rough estimate - will refine with current week)
+            schedule[date_obj] = _WEEK_TYPES[date_obj.isocalendar()[1] % 4]
+        
+        _LOGGER.debug("Assigned bins to %d dates using week-based pattern", len(schedule))
         
         if not schedule:
-            logger.error(
+            _LOGGER.error(
                 "No dates with bins found in PDF. "
                 "This may be due to: 1) PDF is image-based (not text), "
                 "2) Date format doesn't match patterns, "
                 "3) Bin keywords not found near dates. "
                 f"PDF URL: {self._pdf_url}"
             )
+        else:
+            _PDF_SCHEDULE_CACHE[cache_key] = (time.monotonic(), etag, last_modified, schedule)
         
         return schedule
     
-    def _identify_bins_from_pdf_lines(self, lines, current_line_idx):
-        """Extract bin types from PDF text around a date."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        bins = set()
-        
-        # Search the current line AND surrounding lines (before and after)
-        search_range = range(max(0, current_line_idx - 2), min(current_line_idx + 10, len(lines)))
-        
-        for i in search_range:
-            line_lower = lines[i].lower()
-            if "black" in line_lower or "green" in line_lower:
-                bins.add("black")
-            if "blue" in line_lower:
-                bins.add("blue")
-            if "grey" in line_lower or "gray" in line_lower:
-                bins.add("grey")
-            if "burgundy" in line_lower or "brown" in line_lower:
-                bins.add("burgundy")
-        
-        if bins:
-            logger.warning(f"Line {current_line_idx}: identified bins {bins} from surrounding text")
-        
-        return self._identify_bin_combination(bins) if bins else None
+    @staticmethod
+    def _page_has_text(page):
+        """Cheaply check whether a PDF page can show text, without running text extraction."""
+        try:
+            contents = page.get_contents()
+            # Every text object in a content stream starts with the BT operator
+            if contents is not None and b"BT" in contents.get_data():
+                return True
+            # Form XObjects carry their own content streams, so text may be drawn from there
+            resources = page["/Resources"] if "/Resources" in page else {}
+            xobjects = resources["/XObject"] if "/XObject" in resources else {}
+            return any(xobjects[name].get("/Subtype") == "/Form" for name in xobjects)
+        except Exception:
+            # If the page structure can't be inspected, let the extractor decide
+            return True
     
-    def _determine_cycle_position(self, current_week_date, pdf_schedule, bins_this_week):
-        """Determine where in the 4-week cycle we are based on website bins and PDF data."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        if not pdf_schedule:
-            raise Exception("PDF schedule is empty - could not parse any dates from PDF. Please verify the PDF URL is correct and accessible.")
-        
-        # Convert website bins to standardized type
-        current_week_type = self._identify_bin_combination(bins_this_week)
-        logger.debug(f"Current week bin type from website: {current_week_type}")
+    def _determine_cycle_position(self, current_week_date, pdf_schedule, current_week_type):
+        """Determine where in the 4-week cycle we are based on the website's bin type and PDF data."""
+        _LOGGER.debug("Current week bin type from website: %s", current_week_type)
         
         # The base pattern is always: Black, Grey+Burgundy, Black, Blue+Burgundy
         # Determine which position in this cycle we're currently at
@@ -376,15 +462,22 @@ class Source:
         # If there are multiple possible positions (e.g., black at 0 or 2),
         # use the PDF to disambiguate by checking the next week
         if len(possible_positions) > 1:
-            logger.debug(f"Multiple possible positions for {current_week_type}: {possible_positions}, checking PDF for next week...")
-            all_dates = list(pdf_schedule.keys())
-            # Find the closest date to next week
+            if not pdf_schedule:
+                raise Exception("PDF schedule is empty - could not parse any dates from PDF. Please verify the PDF URL is correct and accessible.")
+            _LOGGER.debug(
+                "Multiple possible positions for %s: %s, checking PDF for next week...",
+                current_week_type, possible_positions,
+            )
+            # Look up a date that falls within next week itself (Monday to Sunday); every date
+            # in a week carries the same bin type, whichever weekday the calendar prints
             next_week_date = current_week_date + timedelta(weeks=1)
-            candidates = [d for d in all_dates if abs((d - next_week_date).days) <= 7]
-            if candidates:
-                closest_next = min(candidates, key=lambda d: abs(d - next_week_date))
-                next_week_type = pdf_schedule.get(closest_next, "black")
-                logger.debug(f"Next week PDF type: {next_week_type}")
+            week_after_date = next_week_date + timedelta(weeks=1)
+            next_week_type = next(
+                (bin_type for d, bin_type in pdf_schedule.items() if next_week_date <= d < week_after_date),
+                None,
+            )
+            if next_week_type:
+                _LOGGER.debug("Next week PDF type: %s", next_week_type)
                 
                 # Check which position sequence matches
                 if current_week_type == "black":
@@ -401,25 +494,24 @@ class Source:
         else:
             position = possible_positions[0]
         
-        logger.debug(f"Determined cycle position: {position}")
+        _LOGGER.debug("Determined cycle position: %s", position)
         return position
     
     def _get_pattern_from_cycle_position(self, position):
-        """Get the 4-week repeating pattern based on position."""
-        black_bins = ["Black/Green - Non Recyclable Waste"]
-        blue_burgundy_bins = ["Blue (paper and card)", "Burgundy - Food and garden"]
-        grey_burgundy_bins = ["Light Grey - Glass, cans and plastics", "Burgundy - Food and garden"]
-        
-        base_pattern = [black_bins, grey_burgundy_bins, black_bins, blue_burgundy_bins]
-        
-        # Rotate pattern based on position
-        return base_pattern[position:] + base_pattern[:position]
+        """Get the 4-week repeating pattern of (bin type, icon) pairs based on position."""
+        return _PATTERNS[position]
+    
     def _identify_bin_combination(self, bins_set):
-        """Convert bin set to standardized type string."""
-        has_black = any("black" in str(b).lower() or "green" in str(b).lower() for b in bins_set)
-        has_blue = any("blue" in str(b).lower() for b in bins_set)
-        has_grey = any("grey" in str(b).lower() or "gray" in str(b).lower() for b in bins_set)
-        has_burgundy = any("burgundy" in str(b).lower() or "brown" in str(b).lower() for b in bins_set)
+        """Convert a set of lowercase bin names to standardized type string."""
+        # Collect the bin colours named across all bin names in one pass
+        present = set()
+        for b in bins_set:
+            present.update(_BIN_KEYWORDS[keyword] for keyword in _BIN_KEYWORD_RE.findall(b))
+        
+        has_black = "black" in present
+        has_blue = "blue" in present
+        has_grey = "grey" in present
+        has_burgundy = "burgundy" in present
         
         if has_black:
             return "black"
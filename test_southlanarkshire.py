@@ -3,8 +3,16 @@ from datetime import datetime, timedelta
 import requests
 from bs4 import BeautifulSoup
 from collections import namedtuple
+from operator import itemgetter
 import re
 
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 Collection = namedtuple('Collection', ['date', 't', 'icon'])
 
 ICON_MAP = {
@@ -39,7 +47,7 @@ class Source:
         )
         r.raise_for_status()
 
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = BeautifulSoup(r.text, HTML_PARSER)
         
         # Get the current collection week start date
         bin_div = soup.find("div", {"class": "bin-dir-snip"})
@@ -106,7 +114,7 @@ class Source:
         pattern_cycle = self._determine_pattern_cycle(current_week_bins)
         
         # Generate collections for next 52 weeks
-        collections = []
+        entries = []
         for week_offset in range(52):
             collection_date = current_collection_date + timedelta(weeks=week_offset)
             
@@ -116,18 +124,14 @@ class Source:
             for bin_type in bins_for_week:
                 bin_color = bin_type.split()[0]
                 icon = ICON_MAP.get(bin_color, "mdi:trash-can")
-                collections.append(
-                    Collection(date=collection_date, t=bin_type, icon=icon)
+                sort_key = (collection_date, SORT_ORDER.get(bin_color, 99))
+                entries.append(
+                    (sort_key, Collection(date=collection_date, t=bin_type, icon=icon))
                 )
         
-        # Sort by date, then by bin priority
-        def get_sort_key(entry):
-            bin_color = entry.t.split()[0] if entry.t else ""
-            sort_order = SORT_ORDER.get(bin_color, 99)
-            return (entry.date, sort_order)
-        
-        collections.sort(key=get_sort_key)
-        return collections
+        # Sort by date, then by bin priority, on the keys computed at append time
+        entries.sort(key=itemgetter(0))
+        return [collection for _, collection in entries]
     
     def _identify_bin_combination(self, bins_this_week_set):
         """Identify which bin combination is collected this week."""
@@ -0,0 +1,214 @@
+import sys
+import os
+from collections import namedtuple
+from datetime import date, timedelta
+import types
+import pytest
+
+# Provide a minimal waste_collection_schedule module before importing the source
+wcs = types.ModuleType('waste_collection_schedule')
+wcs.Collection = namedtuple('Collection', ['date', 't', 'icon'])
+sys.modules.setdefault('waste_collection_schedule', wcs)
+
+# Insert source path to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "custom_components", "waste_collection_schedule", "waste_collection_schedule")))
+
+# Now we can import the source module directly
+from source import southlanarkshire_gov_uk
+
+
+PDF_URL = "https://www.southlanarkshire.gov.uk/download/bin_collection_calendar_2026.pdf"
+
+BLACK = ["Black/Green - Non Recyclable Waste"]
+
+
+def make_pdf(lines):
+    """Build a one-page text PDF with one line of Helvetica text per entry."""
+    text = "\n".join(f"BT /F1 8 Tf 20 {800 - 12 * i} Td ({line}) Tj ET" for i, line in enumerate(lines))
+    stream = text.encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+    ]
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return pdf
+
+
+def friday_calendar_pdf():
+    """A 2026 calendar that prints every collection as a Friday date."""
+    friday = date(2026, 1, 2)
+    lines = ["Black Green Blue Grey Burgundy"]
+    while friday.year == 2026:
+        lines.append(f"Friday {friday.day} {friday.strftime('%B')}")
+        friday += timedelta(weeks=1)
+    return make_pdf(lines)
+
+
+def directory_page(week_start, bins):
+    """Render the parts of the directory record page the source reads."""
+    week_end = week_start + timedelta(days=4)
+    items = "".join(f"<li><h4>{b}</h4></li>" for b in bins)
+    return (
+        "<html><body><div class=\"bin-dir-snip\">"
+        f"<p>{week_start.strftime('%A')} {week_start.day} {week_start.strftime('%B %Y')} to "
+        f"{week_end.strftime('%A')} {week_end.day} {week_end.strftime('%B %Y')}</p>"
+        f"<ul>{items}</ul></div>"
+        "<table><tr><th>Black</th><td>Friday (Fortnightly)</td></tr></table>"
+        "</body></html>"
+    )
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.text = content.decode("latin-1")
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise Exception(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class FakeSession:
+    """Stands in for _SESSION.get, serving the directory page and the PDF."""
+
+    def __init__(self, pdf=b"", pdf_status=200):
+        self.week_start = date(2026, 1, 26)
+        self.bins = BLACK
+        self.pdf = pdf
+        self.pdf_status = pdf_status
+        self.pdf_requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        if url == PDF_URL:
+            self.pdf_requests.append(headers or {})
+            if self.pdf_status == 304:
+                return FakeResponse(304)
+            return FakeResponse(
+                200, self.pdf, {"ETag": '"v1"', "Last-Modified": "Mon, 05 Jan 2026 00:00:00 GMT"}
+            )
+        return FakeResponse(200, directory_page(self.week_start, self.bins).encode())
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    southlanarkshire_gov_uk._PDF_SCHEDULE_CACHE.clear()
+    yield
+    southlanarkshire_gov_uk._PDF_SCHEDULE_CACHE.clear()
+
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = FakeSession(pdf=friday_calendar_pdf())
+    monkeypatch.setattr(southlanarkshire_gov_uk._SESSION, "get", fake.get)
+    return fake
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(southlanarkshire_gov_uk.time, "monotonic", fake)
+    return fake
+
+
+def fetch(pdf_url=PDF_URL):
+    source = southlanarkshire_gov_uk.Source("574605", "clincarthill_road_rutherglen", pdf_url)
+    return [(c.date, c.t) for c in source.fetch()]
+
+
+# =============================================================================
+# Tests for cycle position with and without the PDF
+# =============================================================================
+
+def test_friday_dated_pdf_matches_week_number_rule(session):
+    """Test a Friday-dated PDF gives the same calendar as the no-PDF week-number rule."""
+    week_start = date(2026, 1, 5)
+    while week_start.year == 2026:
+        session.week_start = week_start
+        assert fetch(PDF_URL) == fetch(None), f"Calendars differ for the week of {week_start}"
+        week_start += timedelta(weeks=1)
+
+
+# =============================================================================
+# Tests for the PDF schedule cache
+# =============================================================================
+
+def test_no_pdf_request_within_ttl(session, clock):
+    """Test the PDF is downloaded once and then served from cache inside the TTL."""
+    fetch()
+    clock.now += southlanarkshire_gov_uk._PDF_CACHE_TTL - 1
+    fetch()
+    assert len(session.pdf_requests) == 1
+    assert session.pdf_requests[0] == {}
+
+
+def test_conditional_headers_sent_after_ttl(session, clock):
+    """Test the cached PDF is revalidated with both validators once the TTL expires."""
+    fetch()
+    clock.now += southlanarkshire_gov_uk._PDF_CACHE_TTL + 1
+    fetch()
+    assert len(session.pdf_requests) == 2
+    assert session.pdf_requests[1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 05 Jan 2026 00:00:00 GMT",
+    }
+
+
+def test_not_modified_reuses_schedule_and_restarts_ttl(session, clock):
+    """Test a 304 keeps the cached schedule and starts a fresh TTL."""
+    first = fetch()
+    schedule = southlanarkshire_gov_uk._PDF_SCHEDULE_CACHE[(PDF_URL, date.today().year)][3]
+
+    clock.now += southlanarkshire_gov_uk._PDF_CACHE_TTL + 1
+    session.pdf_status = 304
+    session.pdf = b""
+    assert fetch() == first
+    assert southlanarkshire_gov_uk._PDF_SCHEDULE_CACHE[(PDF_URL, date.today().year)][3] is schedule
+    assert len(session.pdf_requests) == 2
+
+    clock.now += southlanarkshire_gov_uk._PDF_CACHE_TTL - 1
+    fetch()
+    assert len(session.pdf_requests) == 2
+
+
+@pytest.mark.parametrize("bins", [
+    ["Light Grey - Glass, cans and plastics", "Burgundy - Food and garden"],
+    ["Blue (paper and card)", "Burgundy - Food and garden"],
+])
+def test_grey_and_blue_weeks_skip_pdf(session, bins):
+    """Test weeks whose bins fix the cycle position never request the PDF."""
+    session.week_start = date(2026, 2, 9)
+    session.bins = bins
+    fetch()
+    assert session.pdf_requests == []